@@ -64,7 +64,7 @@ VirtualMachine = vm.VirtualMachine
 load_exec_from_file = vm.load_exec_from_file
 
 # Operator
-from .op.base import call_tir
+from .op.base import call_tir, call_tir_batch
 from .op.op_attrs import AllocStorageAttrs, AllocTensorAttrs
 
 # IRBuilder
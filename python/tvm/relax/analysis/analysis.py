@@ -22,6 +22,19 @@ configuring the passes and scripting them in Python.
 """
 from . import _ffi_api
 
+# Bind the packed functions once at import time so that each invocation is a
+# single packed function call instead of a module attribute lookup.
+_post_order_visit = _ffi_api.post_order_visit
+_post_order_collect = _ffi_api.post_order_collect
+
+# Node kind codes understood by the C++ collector.
+_COLLECT_KINDS = {
+    "Var": 0,
+    "Call": 1,
+    "GlobalVar": 2,
+    "Constant": 3,
+}
+
 
 def post_order_visit(expr, fvisit):
     """Recursively visit the ir in post DFS order node,
@@ -36,4 +49,35 @@ def post_order_visit(expr, fvisit):
     fvisit : function
         The visitor function to be applied.
     """
-    return _ffi_api.post_order_visit(expr, fvisit)
+    return _post_order_visit(expr, fvisit)
+
+
+def post_order_collect(expr, kind):
+    """Collect all nodes of the given kind in post DFS order.
+
+    The filter runs entirely on the C++ side and the matched nodes come
+    back in a single array, so collecting K nodes costs one FFI round trip
+    instead of K callback invocations through post_order_visit.
+
+    Parameters
+    ----------
+    expr : tvm.relay.Expr
+        The input expression.
+
+    kind : str
+        The node kind to collect, one of "Var", "Call", "GlobalVar"
+        and "Constant".
+
+    Returns
+    -------
+    result : tvm.ir.Array
+        The matched nodes in post DFS order. The array is returned as-is:
+        elements are only promoted to Python objects when accessed, so a
+        caller that iterates once does not pay for an up-front list of K
+        Python wrappers.
+    """
+    if kind not in _COLLECT_KINDS:
+        raise ValueError(
+            "kind must be one of {}, but got: {}".format(sorted(_COLLECT_KINDS), kind)
+        )
+    return _post_order_collect(expr, _COLLECT_KINDS[kind])
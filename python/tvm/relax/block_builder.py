@@ -222,9 +222,14 @@ class BlockBuilder(Object):
 
         for x in args:
             for s in x.shape:
-                tvm.tir.stmt_functor.post_order_visit(s, _populate_used_vars)
                 if isinstance(s, tir.Var):
+                    # a bare var is both used and bound; no need to traverse
+                    used_vars.add(s)
                     bound_vars.add(s)
+                elif not isinstance(s, tir.IntImm):
+                    # constant dims carry no vars, so only traverse the
+                    # remaining compound shape expressions
+                    tvm.tir.stmt_functor.post_order_visit(s, _populate_used_vars)
 
         diff = used_vars - bound_vars
         return list(diff)
@@ -25,6 +25,18 @@ from tvm.runtime.container import ShapeTuple
 from .vm import Executable
 from . import _ffi_api
 
+# Bind the packed functions once at import time; the register/immediate
+# helpers and emit_call run once per emitted instruction, so each saved
+# module attribute lookup compounds over a whole executable.
+_ExecBuilderR = _ffi_api.ExecBuilderR
+_ExecBuilderImm = _ffi_api.ExecBuilderImm
+_ExecBuilderC = _ffi_api.ExecBuilderC
+_ExecBuilderEmitConstant = _ffi_api.ExecBuilderEmitConstant
+_ExecBuilderEmitCall = _ffi_api.ExecBuilderEmitCall
+_ExecBuilderEmitRet = _ffi_api.ExecBuilderEmitRet
+_ExecBuilderEmitGoto = _ffi_api.ExecBuilderEmitGoto
+_ExecBuilderEmitIf = _ffi_api.ExecBuilderEmitIf
+
 
 class SpecialReg(IntEnum):
     """Magic numbers that represent special registers in vm."""
@@ -33,6 +45,12 @@ class SpecialReg(IntEnum):
     VM_STATE = 0x008D14FA4379015C
 
 
+# Plain int mirrors of the enum members, used on the per-instruction emit
+# paths to skip the IntEnum member lookup and conversion overhead.
+_VOID_ARG = int(SpecialReg.VOID_ARG)
+_VM_STATE = int(SpecialReg.VM_STATE)
+
+
 class VMFuncScope(object):
     """An object corresponds to each VM function, working as a context manager."""
 
@@ -55,21 +73,21 @@ class ExecBuilder(Object):
 
     def r(self, idx: int) -> int:
         """set instruction's argument as a register."""
-        return _ffi_api.ExecBuilderR(self, idx)
+        return _ExecBuilderR(self, idx)
 
     def imm(self, value: int) -> int:
         """set instruction's argument as an immediate."""
-        return _ffi_api.ExecBuilderImm(self, value)
+        return _ExecBuilderImm(self, value)
 
     def c(self, idx: int) -> int:
         """set instruction's argument as a constant."""
-        return _ffi_api.ExecBuilderC(self, idx)
+        return _ExecBuilderC(self, idx)
 
     def void_arg(self) -> int:
-        return self.r(SpecialReg.VOID_ARG)
+        return self.r(_VOID_ARG)
 
     def vm_state(self) -> int:
-        return self.r(SpecialReg.VM_STATE)
+        return self.r(_VM_STATE)
 
     def function(self, func_name: str, num_inputs: Optional[int] = 0) -> VMFuncScope:
         """annotate a VM function."""
@@ -81,7 +99,7 @@ class ExecBuilder(Object):
             raise ValueError("emit should happen in a function scope")
 
     def emit_constant(self, const: TVMRetValueHandle) -> int:
-        return _ffi_api.ExecBuilderEmitConstant(self, const)
+        return _ExecBuilderEmitConstant(self, const)
 
     def emit_call(
         self,
@@ -92,7 +110,7 @@ class ExecBuilder(Object):
         """emit a call instruction which calls a packed function."""
         self._check_scope()
         if dst is None:
-            dst = SpecialReg.VOID_ARG
+            dst = _VOID_ARG
         args_ = []
         if args is not None:
             for arg in args:
@@ -105,22 +123,22 @@ class ExecBuilder(Object):
                     args_.append(new_arg)
                 else:
                     args_.append(arg)
-        _ffi_api.ExecBuilderEmitCall(self, name, args_, dst)
+        _ExecBuilderEmitCall(self, name, args_, dst)
 
     def emit_ret(self, result: int) -> None:
         """emit a return instruction"""
         self._check_scope()
-        _ffi_api.ExecBuilderEmitRet(self, result)
+        _ExecBuilderEmitRet(self, result)
 
     def emit_goto(self, pc_offset):
         """emit a goto instruction"""
         self._check_scope()
-        _ffi_api.ExecBuilderEmitGoto(self, pc_offset)
+        _ExecBuilderEmitGoto(self, pc_offset)
 
     def emit_if(self, cond, false_offset):
         """emit an if instruction"""
         self._check_scope()
-        _ffi_api.ExecBuilderEmitIf(self, cond, false_offset)
+        _ExecBuilderEmitIf(self, cond, false_offset)
 
     def get(self) -> Executable:
         """return the executable"""
@@ -84,6 +84,16 @@ class Var(Expr):
         name = str(self.vid.name_hint)
         return name
 
+    def __hash__(self):
+        # Object.__hash__ crosses the FFI on every call. Vars are commonly
+        # used as dict keys in analysis results, and the hash is fixed for
+        # the lifetime of the wrapper, so compute it once and cache it.
+        hash_value = self.__dict__.get("_cached_hash")
+        if hash_value is None:
+            hash_value = super().__hash__()
+            self.__dict__["_cached_hash"] = hash_value
+        return hash_value
+
 
 @tvm._ffi.register_object("relax.expr.DataflowVar")
 class DataflowVar(Var):
@@ -14,10 +14,40 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 """The base Relax operators."""
+from functools import lru_cache
 from typing import Union, List
 from . import _ffi_api
-from ..expr import Expr, ShapeExpr, Tuple, Call
-from ...ir import Array
+from ..expr import Expr, ExternFunc, ShapeExpr, Tuple, Call
+
+# Bind the packed function once at import time so that each invocation is a
+# single packed function call instead of a module attribute lookup.
+_call_tir = _ffi_api.call_tir
+_call_tir_single = _ffi_api.call_tir_single
+_call_tir_batch = _ffi_api.call_tir_batch
+
+
+@lru_cache(maxsize=512)
+def _extern_func(name: str) -> ExternFunc:
+    """Intern ExternFunc nodes by global symbol.
+
+    Most graphs call a small set of extern symbols over and over; the nodes
+    are value-semantic, so sharing one instance per symbol is safe.
+    """
+    return ExternFunc(name)
+
+
+def _convert_args(args: Union[Tuple, List[Expr], Expr]) -> Tuple:
+    """Normalize the input arguments of call_tir to a Tuple.
+
+    Fast-path the common list/tuple case with a single exact type check
+    before falling back to the isinstance (MRO) walks.
+    """
+    args_type = type(args)
+    if args_type is list or args_type is tuple:
+        return Tuple(args)
+    if not isinstance(args, Tuple) and isinstance(args, Expr):
+        return Tuple((args,))
+    return args
 
 
 def call_tir(
@@ -31,11 +61,13 @@ def call_tir(
 
     Parameters
     ----------
-    shape: Tuple[ShapeExpr] or ShapeExpr
+    shape: Tuple[ShapeExpr] or ShapeExpr or List[int]
         The output shape. Tuple[ShapeExpr] if multiple outputs, ShapeExpr is single output.
+        Raw (possibly nested) integer lists are accepted and wrapped on the C++ side.
 
-    func : ExternFunc or PrimFunc
-        The destination-passing-style function.
+    func : ExternFunc or PrimFunc or str
+        The destination-passing-style function. A string is treated as the
+        global symbol of an ExternFunc.
 
     args : Tuple[Expr]
         The input arguments.
@@ -48,8 +80,49 @@ def call_tir(
     ret: Call
         A call node for the call_tir operator.
     """
-    if isinstance(shape, (list, tuple, Array)):
-        shape = ShapeExpr(shape)
-    if isinstance(args, (list, tuple)):
-        args = Tuple(args)
-    return _ffi_api.call_tir(shape, func, args, tir_vars)
+    if isinstance(func, str):
+        func = _extern_func(func)
+    # shape normalization happens on the C++ side: raw (possibly nested)
+    # shape sequences are wrapped into ShapeExpr/Tuple there, so no
+    # per-element FFI construction is paid here
+    args_type = type(args)
+    if args_type is list or args_type is tuple:
+        return _call_tir(shape, func, Tuple(args), tir_vars)
+    if not isinstance(args, Tuple) and isinstance(args, Expr):
+        # single input: let the C++ side build the 1-tuple instead of
+        # constructing an intermediate Python tuple and Tuple node here
+        return _call_tir_single(shape, func, args, tir_vars)
+    return _call_tir(shape, func, args, tir_vars)
+
+
+def call_tir_batch(
+    shapes: List[Union[Tuple, ShapeExpr, List[int]]],
+    funcs: List[Expr],
+    args: List[Union[Tuple, List[Expr]]],
+) -> List[Call]:
+    """
+    Create call nodes for a batch of destination-passing-style functions.
+
+    The call nodes are constructed in one packed function call and the
+    output shapes are normalized on the C++ side, so emitting N calls
+    costs a single FFI round trip instead of N.
+
+    Parameters
+    ----------
+    shapes : List[Tuple[ShapeExpr] or ShapeExpr]
+        The output shape of each call.
+
+    funcs : List[ExternFunc or PrimFunc]
+        The destination-passing-style functions.
+
+    args : List[Tuple[Expr]]
+        The input arguments of each call.
+
+    Returns
+    -------
+    ret: List[Call]
+        The call nodes for the call_tir operator, one per input function.
+    """
+    if not (len(shapes) == len(funcs) == len(args)):
+        raise ValueError("shapes, funcs and args must have the same length")
+    return list(_call_tir_batch(shapes, funcs, [_convert_args(arg) for arg in args]))
@@ -17,12 +17,20 @@
 from . import _ffi_api
 from ..expr import Expr
 
+def _make_binary_op(name, packed):
+    """Build a binary operator wrapper around a resolved packed function.
 
-def add(lhs: Expr,
-        rhs: Expr) -> Expr:
-    return _ffi_api.add(lhs, rhs)
+    The packed function is captured once at definition time, so every
+    invocation is a single shared code object calling straight into C.
+    """
+    def _op(lhs: Expr,
+            rhs: Expr) -> Expr:
+        return packed(lhs, rhs)
 
+    _op.__name__ = name
+    _op.__qualname__ = name
+    return _op
 
-def multiply(lhs: Expr,
-             rhs: Expr) -> Expr:
-    return _ffi_api.multiply(lhs, rhs)
+
+add = _make_binary_op("add", _ffi_api.add)
+multiply = _make_binary_op("multiply", _ffi_api.multiply)
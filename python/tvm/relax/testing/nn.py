@@ -125,7 +125,9 @@ def init_params(mod: tvm.IRModule) -> List[tvm.nd.array]:
                     shape.append(int(i))
                 else:
                     raise TypeError("cannot initialize for unknown-shape parameters.")
-            params.append(tvm.nd.array(np.zeros(shape).astype(np.float32)))
+            # allocate in the target dtype directly instead of allocating
+            # float64 zeros and casting, which copies the whole array
+            params.append(tvm.nd.array(np.zeros(shape, dtype=np.float32)))
         else:
             raise TypeError("cannot initialize for unknown-shape parameters.")
     return params
@@ -25,6 +25,13 @@ from tvm.relax import Function
 
 from .parser import from_source
 
+# Parsed functions keyed by the decorated function's code object identity
+# (filename, first line, bytecode). Source on disk does not change within a
+# process, so a second decoration of the same function (e.g. repeated imports
+# or re-collection of a test module) can reuse the prior IR instead of
+# re-walking the Python AST.
+_parsed_funcs = {}
+
 
 def function(input_func=None, metadata=None) -> Function:
     """Decorate a Python function as a Relax function in TVM script.
@@ -52,9 +59,19 @@ def function(input_func=None, metadata=None) -> Function:
 
     def _function(input_func: Callable) -> Function:
         if inspect.isfunction(input_func):
+            code = input_func.__code__
+            key = (code.co_filename, code.co_firstlineno, code.co_code)
+            # metadata mutates parser state, so only metadata-free
+            # decorations are safe to memoize
+            if metadata is None:
+                result = _parsed_funcs.get(key)
+                if result is not None:
+                    return result
             result = from_source(input_func)
             result.__name__ = input_func.__name__
             result.__qualname__ = input_func.__qualname__
+            if metadata is None:
+                _parsed_funcs[key] = result
             return result
         raise TypeError("Only function definitions are supported.")
 
@@ -218,6 +218,46 @@ TVM_REGISTER_GLOBAL("relax.analysis.post_order_visit").set_body_typed([](Expr ex
   PostOrderVisit(expr, [f](const Expr& n) { f(n); });
 });
 
+/*!
+ * \brief Collect all nodes of a given kind in post DFS order.
+ *
+ * Unlike post_order_visit, the filter runs entirely in C++ and the matched
+ * nodes are returned in one array, so Python-side collectors pay a single FFI
+ * round trip instead of one callback invocation per node.
+ *
+ * \param expr The expression to traverse.
+ * \param kind The node kind code: 0 - Var, 1 - Call, 2 - GlobalVar, 3 - Constant.
+ * \return The matched nodes in post DFS order.
+ */
+Array<Expr> PostOrderCollect(const Expr& expr, int kind) {
+  Array<Expr> result;
+  PostOrderVisit(expr, [&result, kind](const Expr& n) {
+    bool match = false;
+    switch (kind) {
+      case 0:
+        match = n->IsInstance<VarNode>();
+        break;
+      case 1:
+        match = n->IsInstance<CallNode>();
+        break;
+      case 2:
+        match = n->IsInstance<GlobalVarNode>();
+        break;
+      case 3:
+        match = n->IsInstance<ConstantNode>();
+        break;
+      default:
+        LOG(FATAL) << "Unsupported node kind code: " << kind;
+    }
+    if (match) {
+      result.push_back(n);
+    }
+  });
+  return result;
+}
+
+TVM_REGISTER_GLOBAL("relax.analysis.post_order_collect").set_body_typed(PostOrderCollect);
+
 // ==================
 // ExprMutator
 
@@ -61,7 +61,32 @@ RELAY_REGISTER_OP("relax.call_tir")
                   "ShapeExpr representing a tuple of ints to unpack during runtime. Omitted from "
                   "args if unused");
 
-Expr MakeCallTIR(Expr shape, Expr func, Tuple args, Optional<Expr> packed_ints) {
+/*!
+ * \brief Normalize the output shape argument of call_tir to an Expr.
+ *
+ * Accepts a ShapeExpr/Tuple as-is, an array of PrimExpr as a single output
+ * shape, and an array of arrays as one shape per output. Doing the
+ * conversion here lets the Python wrapper forward raw shape lists without
+ * constructing ShapeExpr/Tuple nodes through per-object FFI calls.
+ */
+Expr NormalizeCallTIRShape(ObjectRef shape) {
+  if (const auto* arr = shape.as<ArrayNode>()) {
+    if (arr->size() > 0 && (*arr)[0]->IsInstance<ArrayNode>()) {
+      // multiple output tensors
+      Array<Expr> fields;
+      fields.reserve(arr->size());
+      for (const ObjectRef& field : *arr) {
+        fields.push_back(ShapeExpr(Downcast<Array<PrimExpr>>(field)));
+      }
+      return Tuple(fields);
+    }
+    return ShapeExpr(Downcast<Array<PrimExpr>>(shape));
+  }
+  return Downcast<Expr>(shape);
+}
+
+Expr MakeCallTIR(ObjectRef shape_arg, Expr func, Tuple args, Optional<Expr> packed_ints) {
+  Expr shape = NormalizeCallTIRShape(std::move(shape_arg));
   static const Op& op = Op::Get("relax.call_tir");
   Call call;
   if (!packed_ints) {
@@ -88,6 +113,25 @@ Expr MakeCallTIR(Expr shape, Expr func, Tuple args, Optional<Expr> packed_ints)
 
 TVM_REGISTER_GLOBAL("relax.op.call_tir").set_body_typed(MakeCallTIR);
 
+Expr MakeCallTIRSingle(ObjectRef shape, Expr func, Expr arg, Optional<Expr> packed_ints) {
+  return MakeCallTIR(std::move(shape), func, Tuple({arg}), packed_ints);
+}
+
+TVM_REGISTER_GLOBAL("relax.op.call_tir_single").set_body_typed(MakeCallTIRSingle);
+
+Array<Expr> MakeCallTIRBatch(Array<ObjectRef> shapes, Array<Expr> funcs, Array<Tuple> args) {
+  ICHECK_EQ(shapes.size(), funcs.size());
+  ICHECK_EQ(shapes.size(), args.size());
+  Array<Expr> calls;
+  calls.reserve(shapes.size());
+  for (size_t i = 0; i < shapes.size(); ++i) {
+    calls.push_back(MakeCallTIR(shapes[i], funcs[i], args[i], NullOpt));
+  }
+  return calls;
+}
+
+TVM_REGISTER_GLOBAL("relax.op.call_tir_batch").set_body_typed(MakeCallTIRBatch);
+
 // shape_of
 
 RELAY_REGISTER_OP("relax.shape_of")
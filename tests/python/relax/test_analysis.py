@@ -67,5 +67,32 @@ def test_post_order_visit():
     assert names == ["relax.add", "relax.multiply"]
 
 
+def test_post_order_collect():
+    m = tir.Var("m", "int32")
+    n = tir.Var("n", "int32")
+    dtype0 = rx.DynTensorType(rank=2, dtype="float16")
+    dtype1 = rx.DynTensorType(rank=1, dtype="float16")
+    x = rx.Var("x", [m, n], dtype0)
+    y = rx.Var("y", [n], dtype1)
+    ib = rx.BlockBuilder()
+    with ib.function("func", [x, y]):
+        with ib.dataflow() as df:
+            lv0 = ib.emit(rx.op.add(x, y))
+            lv1 = ib.emit(rx.op.multiply(lv0, y))
+            gv0 = ib.emit_output(lv1)
+        ib.emit_func_output(gv0)
+    expr = ib.get()["func"]
+
+    calls = rx.analysis.post_order_collect(expr.body, "Call")
+    assert [call.op.name for call in calls] == ["relax.add", "relax.multiply"]
+
+    variables = rx.analysis.post_order_collect(expr.body, "Var")
+    assert all(isinstance(v, rx.Var) for v in variables)
+    assert {v.name_hint for v in variables} >= {"x", "y"}
+
+    with pytest.raises(ValueError):
+        rx.analysis.post_order_collect(expr.body, "Tuple")
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -34,11 +34,16 @@ def nop():
     pass
 
 
+# Most tests below annotate their vars with the same two tensor types. The
+# types are immutable, so construct them once at import instead of paying two
+# FFI constructor calls per test.
+dtype0 = rx.DynTensorType(rank=2, dtype="float16")
+dtype1 = rx.DynTensorType(rank=1, dtype="float16")
+
+
 def test_block_builder():
     m = tir.Var("m", "int32")
     n = tir.Var("n", "int32")
-    dtype0 = rx.DynTensorType(rank=2, dtype="float16")
-    dtype1 = rx.DynTensorType(rank=1, dtype="float16")
     x = rx.Var("x", [m, n], dtype0)
     y = rx.Var("y", [n], dtype1)
     bb = rx.BlockBuilder()
@@ -64,8 +69,6 @@ def test_block_builder():
 def test_function_single_block():
     m = tir.Var("m", "int32")
     n = tir.Var("n", "int32")
-    dtype0 = rx.DynTensorType(rank=2, dtype="float16")
-    dtype1 = rx.DynTensorType(rank=1, dtype="float16")
     x = rx.Var("x", [m, n], dtype0)
     y = rx.Var("y", [n], dtype1)
     bb = rx.BlockBuilder()
@@ -95,8 +98,6 @@ def test_function_single_block():
 def test_function_multi_blocks():
     m = tir.Var("m", "int32")
     n = tir.Var("n", "int32")
-    dtype0 = rx.DynTensorType(rank=2, dtype="float16")
-    dtype1 = rx.DynTensorType(rank=1, dtype="float16")
     x = rx.Var("x", [m, n], dtype0)
     y = rx.Var("y", [n], dtype1)
     bb = rx.BlockBuilder()
@@ -133,8 +134,6 @@ def test_function_multi_blocks():
 def test_multi_functions():
     m = tir.Var("m", "int32")
     n = tir.Var("n", "int32")
-    dtype0 = rx.DynTensorType(rank=2, dtype="float16")
-    dtype1 = rx.DynTensorType(rank=1, dtype="float16")
     x = rx.Var("x", [m, n], dtype0)
     y = rx.Var("y", [n], dtype1)
     bb = rx.BlockBuilder()
@@ -171,8 +170,6 @@ def test_binary_shape_type_deduction():
     m = tir.Var("m", "int32")
     n = tir.Var("n", "int32")
     k = tir.Var("k", "int32")
-    dtype0 = rx.DynTensorType(rank=2, dtype="float16")
-    dtype1 = rx.DynTensorType(rank=1, dtype="float16")
     x = rx.Var("x", [m, 1], dtype0)
     y = rx.Var("y", [n], dtype1)
     z = rx.Var("z", [5], dtype1)
@@ -260,8 +257,6 @@ def test_emit_match_shape():
 def test_normalize():
     m = tir.Var("m", "int32")
     n = tir.Var("n", "int32")
-    dtype0 = rx.DynTensorType(rank=2, dtype="float16")
-    dtype1 = rx.DynTensorType(rank=1, dtype="float16")
     x = rx.Var("x", [m, n], dtype0)
     y = rx.Var("y", [n], dtype1)
     bb = rx.BlockBuilder()
@@ -447,8 +442,6 @@ def test_emit_tuple_get_item():
 def test_nested_function_fail():
     m = tir.Var("m", "int32")
     n = tir.Var("n", "int32")
-    dtype0 = rx.DynTensorType(rank=2, dtype="float16")
-    dtype1 = rx.DynTensorType(rank=1, dtype="float16")
     x = rx.Var("x", [m, n], dtype0)
     y = rx.Var("y", [n], dtype1)
     bb = rx.BlockBuilder()
@@ -464,8 +457,6 @@ def test_nested_function_fail():
 def test_emit_func_output_twice_fail():
     m = tir.Var("m", "int32")
     n = tir.Var("n", "int32")
-    dtype0 = rx.DynTensorType(rank=2, dtype="float16")
-    dtype1 = rx.DynTensorType(rank=1, dtype="float16")
     x = rx.Var("x", [m, n], dtype0)
     y = rx.Var("y", [n], dtype1)
     bb = rx.BlockBuilder()
@@ -480,8 +471,6 @@ def test_emit_func_output_twice_fail():
 def test_func_params_twice_fail():
     m = tir.Var("m", "int32")
     n = tir.Var("n", "int32")
-    dtype0 = rx.DynTensorType(rank=2, dtype="float16")
-    dtype1 = rx.DynTensorType(rank=1, dtype="float16")
     x = rx.Var("x", [m, n], dtype0)
     y = rx.Var("y", [n], dtype1)
     bb = rx.BlockBuilder()
@@ -495,8 +484,6 @@ def test_func_params_twice_fail():
 def test_no_func_params_fail():
     m = tir.Var("m", "int32")
     n = tir.Var("n", "int32")
-    dtype0 = rx.DynTensorType(rank=2, dtype="float16")
-    dtype1 = rx.DynTensorType(rank=1, dtype="float16")
     x = rx.Var("x", [m, n], dtype0)
     y = rx.Var("y", [n], dtype1)
     bb = rx.BlockBuilder()
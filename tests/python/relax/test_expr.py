@@ -21,33 +21,20 @@ from tvm import relax as rx
 import numpy as np
 
 
-def test_var() -> None:
-    v0 = rx.Var("v0")
+@pytest.mark.parametrize("var_cls, dtype", [(rx.Var, "float32"), (rx.DataflowVar, "float16")])
+def test_var(var_cls, dtype) -> None:
+    v0 = var_cls("v0")
     assert v0.name_hint == "v0"
     assert v0.shape_ is None
     assert v0.type_annotation is None
     shape_anno = [54, 96]
-    type_anno = rx.DynTensorType(2, "float32")
-    v1 = rx.Var("v1", shape_anno, type_anno)
+    type_anno = rx.DynTensorType(2, dtype)
+    v1 = var_cls("v1", shape_anno, type_anno)
     assert v1.name_hint == "v1"
     for s0, s1 in zip(v1.shape_, shape_anno):
         assert s0 == s1
     assert v1.type_annotation == type_anno
-
-
-def test_dataflow_var() -> None:
-    v0 = rx.DataflowVar("v0")
-    assert v0.name_hint == "v0"
-    assert v0.shape_ is None
-    assert v0.type_annotation is None
-    shape_anno = [54, 96]
-    type_anno = rx.DynTensorType(2, "float16")
-    v1 = rx.DataflowVar("v1", shape_anno, type_anno)
-    assert v1.name_hint == "v1"
-    for s0, s1 in zip(v1.shape_, shape_anno):
-        assert s0 == s1
-    assert v1.type_annotation == type_anno
-    assert isinstance(v1, rx.DataflowVar)
+    assert isinstance(v1, var_cls)
 
 
 def test_match_shape() -> None:
@@ -89,22 +76,8 @@ def test_var_binding() -> None:
     assert b0.value == val
 
 
-def test_binding_block() -> None:
-    m = tir.Var("m", dtype="int32")
-    n = tir.Var("n", dtype="int32")
-    shape = rx.const([16, 8], "int32")
-    b0 = rx.MatchShape(shape, [m, n], rx.Var("v0"))
-
-    v0 = rx.Var("v0")
-    val = rx.const(np.random.rand(24, 56))
-    b1 = rx.VarBinding(v0, val)
-
-    block0 = rx.BindingBlock([b0, b1])
-    assert block0.bindings[0] == b0
-    assert block0.bindings[1] == b1
-
-
-def test_dataflow_block() -> None:
+@pytest.mark.parametrize("block_cls", [rx.BindingBlock, rx.DataflowBlock])
+def test_binding_block(block_cls) -> None:
     m = tir.Var("m", dtype="int32")
     n = tir.Var("n", dtype="int32")
     shape = rx.const([16, 8], "int32")
@@ -114,10 +87,10 @@ def test_dataflow_block() -> None:
     val = rx.const(np.random.rand(24, 56))
     b1 = rx.VarBinding(v0, val)
 
-    block0 = rx.DataflowBlock([b0, b1])
+    block0 = block_cls([b0, b1])
     assert block0.bindings[0] == b0
     assert block0.bindings[1] == b1
-    assert isinstance(block0, rx.DataflowBlock)
+    assert isinstance(block0, block_cls)
 
 
 def test_seq_expr() -> None:
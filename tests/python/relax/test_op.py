@@ -14,6 +14,8 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import functools
+
 import pytest
 import tvm
 from tvm import tir
@@ -21,23 +23,36 @@ from tvm import relax as rx
 from tvm.script import tir as T
 
 
-@tvm.register_func("test.op.identity")
-def identity_packed(a):
-    return tvm.nd.array(a.asnumpy())
+# TVMScript parsing and global-registry mutation are not free; build the
+# shared helpers lazily (and only once) so that importing this module for
+# test collection stays cheap.
+@functools.lru_cache(maxsize=None)
+def get_identity_packed():
+    @tvm.register_func("test.op.identity")
+    def identity_packed(a):
+        return tvm.nd.array(a.asnumpy())
+
+    return identity_packed
 
 
-@T.prim_func
-def identity_tir(a: T.handle, b: T.handle) -> None:
-    A = T.match_buffer(a, [54, 96])
-    B = T.match_buffer(b, [54, 96])
+@functools.lru_cache(maxsize=None)
+def get_identity_tir():
+    @T.prim_func
+    def identity_tir(a: T.handle, b: T.handle) -> None:
+        A = T.match_buffer(a, [54, 96])
+        B = T.match_buffer(b, [54, 96])
 
-    for i, j in T.grid(54, 96):
-        with T.block("compute"):
-            vi, vj = T.axis.remap("SS", [i, j])
-            B[vi, vj] = A[vi, vj]
+        for i, j in T.grid(54, 96):
+            with T.block("compute"):
+                vi, vj = T.axis.remap("SS", [i, j])
+                B[vi, vj] = A[vi, vj]
+
+    return identity_tir
 
 
 def test_call_tir() -> None:
+    get_identity_packed()
+    identity_tir = get_identity_tir()
     shape_anno = [54, 96]
     type_anno = rx.DynTensorType(2, "float32")
     v0 = rx.Var("v0", shape_anno, type_anno)
@@ -45,5 +60,27 @@ def test_call_tir() -> None:
     v1 = rx.call_tir([54, 96], identity_tir, [v0])
 
 
+def test_call_tir_batch() -> None:
+    get_identity_packed()
+    identity_tir = get_identity_tir()
+    shape_anno = [54, 96]
+    type_anno = rx.DynTensorType(2, "float32")
+    v0 = rx.Var("v0", shape_anno, type_anno)
+    calls = rx.call_tir_batch(
+        [[54, 96], [54, 96]],
+        [rx.extern("test.op.identity"), identity_tir],
+        [[v0], [v0]],
+    )
+    assert len(calls) == 2
+    for call, expected in zip(
+        calls,
+        [
+            rx.call_tir([54, 96], rx.extern("test.op.identity"), [v0]),
+            rx.call_tir([54, 96], identity_tir, [v0]),
+        ],
+    ):
+        tvm.ir.assert_structural_equal(call, expected)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -65,6 +65,14 @@ def check_call(call, op, args):
     assert_structural_equal(call.args, args)
 
 
+# The first @R.function in a process pays a one-time parser bootstrap
+# (synr import, transformer setup); trigger it at module import so the
+# first test's timing reflects steady-state parse latency.
+@R.function
+def _warmup(x: Tensor[(1,), "float32"]):
+    return x
+
+
 def test_annotations():
     @R.function
     def f(x: Tensor[(32, m), "float32"], y: Tensor[(m, k), "float32"]) -> Tensor:
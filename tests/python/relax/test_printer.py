@@ -17,25 +17,39 @@
 
 from __future__ import annotations  # must import to defer parsing of annotations
 
+import os
+
 import pytest
 import tvm
 
 from tvm import relax
 from tvm import tir, relay
-from tvm.ir import structural_equal, assert_structural_equal
+from tvm.ir import structural_equal, structural_hash, assert_structural_equal
 
 import tvm.script
 from tvm.relax.utils import metadata_partitioner
 from tvm.script import tir as T, relax as R
 
 
+# The print+re-parse round trip doubles parser work per test. Setting
+# TVM_TEST_ROUNDTRIP=0 reduces check_roundtrip to printing only, for quick
+# local iteration; the default (and CI) keeps the full round trip, since
+# that is what this file exists to cover.
+_RUN_ROUNDTRIP = os.environ.get("TVM_TEST_ROUNDTRIP", "1") != "0"
+
+
 def check_roundtrip(f_pre):
     relax_text = R.parser.astext(f_pre, show_meta_data=True)
+    if not _RUN_ROUNDTRIP:
+        return
     f_post = R.parser.from_source(input_func=relax_text)
     if isinstance(f_pre, tvm.IRModule) and not isinstance(f_post, tvm.IRModule):
         global_vars = f_pre.get_global_vars()
         f_post = tvm.IRModule({global_vars[0]: f_post}, attrs=metadata)
-    assert_structural_equal(f_pre, f_post, map_free_vars=True)
+    # comparing structural hashes is one FFI call per side; only fall back to
+    # the node-by-node walk when they differ, to get a readable diff
+    if structural_hash(f_pre, map_free_vars=True) != structural_hash(f_post, map_free_vars=True):
+        assert_structural_equal(f_pre, f_post, map_free_vars=True)
 
 
 def test_annotations():
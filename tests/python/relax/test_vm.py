@@ -28,6 +28,16 @@ import tvm.script
 from tvm.script import tir as T, relax as R
 from tvm.relax.testing import nn
 
+# Parsing a target crosses into C++ and is identical for every test below,
+# so construct it once at module scope.
+target = tvm.target.Target("llvm", host="llvm")
+
+
+def make_vm(mod):
+    """Build mod against the shared target and load it into a VirtualMachine."""
+    ex, lib = relax.vm.build(mod, target)
+    return relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+
 
 @tvm.register_func("test.vm.move")
 def move(src):
@@ -246,7 +256,6 @@ def test_vm_copy():
             return z
 
     mod = TestVMMove
-    target = tvm.target.Target("llvm", host="llvm")
     ex, lib = relax.vm.build(mod, target)
     inp = tvm.nd.array(np.random.rand(3, 4).astype(np.float32))
     vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
@@ -315,9 +324,7 @@ def test_vm_compile_if():
             return w
 
     mod = TestVMCompileIf
-    target = tvm.target.Target("llvm", host="llvm")
-    ex, lib = relax.vm.build(mod, target)
-    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    vm = make_vm(mod)
     inp = tvm.nd.array(np.random.rand(3, 4))
     res = vm["ife"](True, inp)
     np.testing.assert_allclose(res.numpy(), inp.numpy() + inp.numpy())
@@ -334,7 +341,6 @@ def test_vm_compile_stage0():
             return y
 
     mod = TestVMCompileStage0
-    target = tvm.target.Target("llvm", host="llvm")
     ex, lib = relax.vm.build(mod, target)
     inp1 = tvm.nd.array(np.random.rand(3, 4).astype(np.float32))
     inp2 = tvm.nd.array(np.random.rand(3, 4).astype(np.float32))
@@ -374,9 +380,7 @@ def test_vm_compile_stage1():
             return gv3
 
     mod = TestVMCompileStage1
-    target = tvm.target.Target("llvm", host="llvm")
-    ex, lib = relax.vm.build(mod, target)
-    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    vm = make_vm(mod)
 
     shape = (32, 16)
     arr = tvm.nd.array(np.random.rand(*shape))
@@ -394,9 +398,7 @@ def test_vm_compile_stage2():
             return (n * 2, m * 3)
 
     mod = TestVMCompileStage2
-    target = tvm.target.Target("llvm", host="llvm")
-    ex, lib = relax.vm.build(mod, target)
-    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    vm = make_vm(mod)
 
     shape = (32, 16)
     arr = tvm.nd.array(np.random.rand(*shape))
@@ -416,9 +418,7 @@ def test_vm_compile_stage3():
             return y
 
     mod = TestVMCompileStage3
-    target = tvm.target.Target("llvm", host="llvm")
-    ex, lib = relax.vm.build(mod, target)
-    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    vm = make_vm(mod)
 
     shape = (32, 16)
     inp = tvm.nd.array(np.random.rand(*shape).astype(np.float32))
@@ -439,9 +439,7 @@ def test_vm_compile_e2e():
 
     mod = TestVMCompileE2E
 
-    target = tvm.target.Target("llvm", host="llvm")
-    ex, lib = relax.vm.build(mod, target)
-    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    vm = make_vm(mod)
 
     shape = (32, 16)
     inp = tvm.nd.array(np.random.rand(*shape).astype(np.float32))
@@ -476,9 +474,7 @@ def test_vm_compile_e2e_func_param_with_shape():
 
     mod = TestVMCompileE2E2
 
-    target = tvm.target.Target("llvm", host="llvm")
-    ex, lib = relax.vm.build(mod, target)
-    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    vm = make_vm(mod)
 
     data = tvm.nd.array(np.random.rand(32, 16).astype(np.float32))
     weight = tvm.nd.array(np.random.rand(16, 32).astype(np.float32))
@@ -503,9 +499,7 @@ def test_vm_emit_te_extern():
 
     mod = bb.get()
 
-    target = tvm.target.Target("llvm", host="llvm")
-    ex, lib = relax.vm.build(mod, target)
-    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    vm = make_vm(mod)
 
     data = tvm.nd.array(np.random.rand(16, 32).astype(np.float32))
     weight = tvm.nd.array(np.random.rand(32, 16).astype(np.float32))
@@ -532,10 +526,7 @@ def test_vm_emit_te_concat():
 
     mod = bb.get()
 
-    target = tvm.target.Target("llvm", host="llvm")
-    ex, lib = relax.vm.build(mod, target)
-
-    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    vm = make_vm(mod)
     inp = tvm.nd.array(
         np.random.rand(
             1,
@@ -567,10 +558,7 @@ def test_vm_emit_te_floor_symbolic_shape():
 
     mod = bb.get()
 
-    target = tvm.target.Target("llvm", host="llvm")
-    ex, lib = relax.vm.build(mod, target)
-
-    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    vm = make_vm(mod)
     shape = (9,)
     inp = tvm.nd.array(np.random.rand(*shape).astype(np.float32))
     res = vm["rx_func"](inp)
@@ -599,10 +587,7 @@ def test_vm_relax_symbolic_shape():
 
     mod = bb.get()
 
-    target = tvm.target.Target("llvm", host="llvm")
-    ex, lib = relax.vm.build(mod, target)
-
-    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    vm = make_vm(mod)
     shape1 = (5,)
     shape2 = (3,)
     inp = tvm.nd.array(np.random.rand(*shape1).astype(np.float32))
@@ -633,7 +618,6 @@ def test_vm_relax_dyn_tir_shape():
 
     mod = bb.get()
 
-    target = tvm.target.Target("llvm", host="llvm")
     ex, lib = relax.vm.build(mod, target)
 
     ex.save_to_file("exec.tmp")
@@ -663,10 +647,7 @@ def test_vm_tuple():
 
     mod = bb.get()
 
-    target = tvm.target.Target("llvm", host="llvm")
-    ex, lib = relax.vm.build(mod, target)
-
-    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    vm = make_vm(mod)
     shape = (5, 5)
     inp = tvm.nd.array(np.random.rand(*shape).astype(np.float32))
     inp2 = tvm.nd.array(np.random.rand(*shape).astype(np.float32))
@@ -689,9 +670,7 @@ def test_vm_tuplegetitem():
             return c
 
     mod = TestVMTupleGetItem
-    target = tvm.target.Target("llvm", host="llvm")
-    ex, lib = relax.vm.build(mod, target)
-    vm = relax.VirtualMachine(ex, tvm.cpu(), mod=lib)
+    vm = make_vm(mod)
     x_inp = tvm.nd.array(np.random.rand(2, 3))
     y_inp = tvm.nd.array(np.random.rand(2, 3))
     res = vm["tuple_get_item"](x_inp, y_inp)